@@ -1,7 +1,7 @@
 pnpm build
 rm -rf out/plugin || true
 mkdir -p out/plugin
-cp -r dist package.json plugin.json main.py README.md LICENSE out/plugin/
+cp -r dist py_modules package.json plugin.json main.py README.md LICENSE out/plugin/
 cd out
 rm -rf sd-schoolnet-autologin.zip || true
 zip -r sd-schoolnet-autologin.zip plugin
@@ -4,47 +4,123 @@ Automatically logs in to campus network (DrCom) when internet connectivity is lo
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import copy
+import functools
 import json
 import os
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import decky
 
+try:
+    from icmplib import (
+        SocketPermissionError,
+        async_multiping,
+        async_ping,
+        async_resolve,
+        is_hostname,
+    )
+except ImportError:  # icmplib not bundled, fall back to the ping binary
+    async_ping = None
+    async_multiping = None
+    SocketPermissionError = None
+
+# Default configuration, deep-copied whenever a fresh config is needed
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "login_ip": "221.1.64.43",
+    "use_https": False,
+    "login_path": "/drcom/login",
+    "method": "GET",
+    "params": {
+        "callback": "dr1003",
+        "DDDDD": "",
+        "upass": "",
+        "0MKKey": "123456",
+        "R1": "0",
+        "R2": "",
+        "R3": "1",
+        "R6": "0",
+        "para": "00",
+        "v6ip": "",
+        "terminal_type": "1",
+        "lang": "zh-cn",
+        "jsVersion": "4.2.1",
+    },
+    "ping_target": "8.8.8.8",
+    "ping_targets": [],
+    "ping_interval_sec": 60,
+    "ping_timeout_sec": 2,
+    "consecutive_failures_threshold": 3,
+    "backoff_attempt_sec": 60,
+    "success_check_string": "",
+}
+
 
 class Plugin:
     """Main plugin class for campus network auto-login."""
 
     # Configuration constants
-    DEFAULT_LOGIN_IP = "221.1.64.43"
-    DEFAULT_PING_TARGET = "8.8.8.8"
+    DEFAULT_LOGIN_IP = _DEFAULT_CONFIG_TEMPLATE["login_ip"]
+    DEFAULT_PING_TARGET = _DEFAULT_CONFIG_TEMPLATE["ping_target"]
     DEFAULT_CONFIG_FILE = "config.json"
     HTTP_TIMEOUT = 10
     USER_AGENT = "Mozilla/5.0"
+    BODY_PREVIEW_BYTES = 1024
+    HEALTHY_STREAK_BEFORE_BACKOFF = 3
+    MAX_PING_INTERVAL_SEC = 600
+    PING_STATUS_HEARTBEAT_SEC = 300
 
     def __init__(self):
         """Initialize the plugin."""
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._monitor_task: Optional[asyncio.Task[Any]] = None
+        self._icmp_unavailable = False
+        self._config_dirty = asyncio.Event()
+        self._config_file_path: Optional[str] = None
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._login_configured = False
+        self._config_mtime: float = 0
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._encoded_static_key: Optional[tuple] = None
+        self._encoded_static_params = ""
+        self._success_check_str = ""
+        self._success_check_encoded = b""
+        self._opener = urllib.request.build_opener()
+        self._opener.addheaders = [("User-Agent", self.USER_AGENT)]
 
     # ============= Lifecycle Methods =============
 
     async def _main(self) -> None:
         """Called when plugin loads. Initialize event loop and log startup."""
-        self.loop = asyncio.get_event_loop()
+        self.loop = asyncio.get_running_loop()
+        try:
+            self._init_config_dir()
+        except Exception as e:
+            # _config_path retries lazily, inside the config methods' error handling
+            decky.logger.error("Failed to create config directory: %s", e)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="schoolnet-http"
+        )
         decky.logger.info("Campus Network Auto-Login plugin loaded")
 
     async def _unload(self) -> None:
         """Called when plugin unloads. Stop monitoring and cleanup."""
         decky.logger.info("Plugin unloading")
         if self._monitor_task and not self._monitor_task.done():
-            try:
-                self._monitor_task.cancel()
-            except Exception as e:
-                decky.logger.error(f"Error stopping monitor: {e}")
+            self._monitor_task.cancel()
+            # Wait for the task to finish so any ping child process is reaped
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     async def _uninstall(self) -> None:
         """Called when plugin is uninstalled."""
@@ -71,45 +147,47 @@ class Plugin:
 
     # ============= Configuration Methods =============
 
-    def _config_dir(self) -> str:
-        """Get the plugin-specific configuration directory."""
+    def _init_config_dir(self) -> str:
+        """Create the plugin config directory; cache and return the config path."""
         plugin_dir = os.path.join(decky.DECKY_PLUGIN_SETTINGS_DIR, "schoolnet-autologin")
         os.makedirs(plugin_dir, exist_ok=True)
-        return plugin_dir
+        self._config_file_path = os.path.join(plugin_dir, self.DEFAULT_CONFIG_FILE)
+        return self._config_file_path
 
     def _config_path(self) -> str:
         """Get the path to the configuration file."""
-        return os.path.join(self._config_dir(), "config.json")
+        return self._config_file_path or self._init_config_dir()
 
     def _default_config(self) -> Dict[str, Any]:
         """Return default configuration."""
-        return {
-            "login_ip": self.DEFAULT_LOGIN_IP,
-            "use_https": False,
-            "login_path": "/drcom/login",
-            "method": "GET",
-            "params": {
-                "callback": "dr1003",
-                "DDDDD": "",
-                "upass": "",
-                "0MKKey": "123456",
-                "R1": "0",
-                "R2": "",
-                "R3": "1",
-                "R6": "0",
-                "para": "00",
-                "v6ip": "",
-                "terminal_type": "1",
-                "lang": "zh-cn",
-                "jsVersion": "4.2.1",
-            },
-            "ping_target": self.DEFAULT_PING_TARGET,
-            "ping_interval_sec": 60,
-            "ping_timeout_sec": 2,
-            "consecutive_failures_threshold": 3,
-            "backoff_attempt_sec": 60,
-            "success_check_string": "",
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+
+    def _read_config_file(self, path: str) -> Dict[str, Any]:
+        """Parse the configuration file at path."""
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _write_config_file(self, path: str, cfg: Dict[str, Any]) -> None:
+        """Atomically serialize cfg to the configuration file at path."""
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(cfg, f, indent=2)
+        # Rename over the old file so a crash never leaves it half-written
+        os.replace(tmp, path)
+
+    def _update_config_cache(
+        self, cfg: Dict[str, Any], path: str, mtime: Optional[float] = None
+    ) -> None:
+        """Remember the parsed configuration along with the file's mtime."""
+        self._encoded_static_key = None
+        self._config_cache = cfg
+        self._config_mtime = os.stat(path).st_mtime if mtime is None else mtime
+        self._update_login_configured(cfg)
+
+    def _update_login_configured(self, cfg: Dict[str, Any]) -> None:
+        """Record whether cfg has the credentials do_login needs."""
+        params = cfg.get("params", {})
+        self._login_configured = bool(params.get("DDDDD") and params.get("upass"))
 
     async def get_config(self) -> Dict[str, Any]:
         """Read and return configuration, creating defaults if missing."""
@@ -117,49 +195,155 @@ class Plugin:
             path = self._config_path()
             if not os.path.exists(path):
                 cfg = self._default_config()
-                with open(path, "w") as f:
-                    json.dump(cfg, f, indent=2)
+                self._write_config_file(path, cfg)
                 decky.logger.info("Created default configuration at: %s", path)
-                return cfg
+                self._update_config_cache(cfg, path)
+                return cfg.copy()
 
-            with open(path, "r") as f:
-                return json.load(f)
+            st = os.stat(path)
+            if self._config_cache is not None and st.st_mtime == self._config_mtime:
+                return self._config_cache.copy()
+
+            cfg = self._read_config_file(path)
+            self._update_config_cache(cfg, path, st.st_mtime)
+            return cfg.copy()
         except Exception as e:
-            decky.logger.error(f"Failed to load config: {e}")
-            return self._default_config()
+            decky.logger.error("Failed to load config: %s", e)
+            cfg = self._default_config()
+            self._update_login_configured(cfg)
+            return cfg
 
     async def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file."""
         try:
             path = self._config_path()
-            with open(path, "w") as f:
-                json.dump(config, f, indent=2)
+            self._write_config_file(path, config)
+            self._update_config_cache(config, path)
+            self._config_dirty.set()
             decky.logger.info("Configuration saved successfully")
         except Exception as e:
-            decky.logger.error(f"Failed to save config: {e}")
+            decky.logger.error("Failed to save config: %s", e)
 
     async def reset_config(self) -> Dict[str, Any]:
         """Reset configuration to defaults and save to file."""
         try:
             path = self._config_path()
-            if os.path.exists(path):
-                os.remove(path)
-                decky.logger.info("Old configuration file deleted")
-            
             cfg = self._default_config()
-            # Save the default config to file
-            with open(path, "w") as f:
-                json.dump(cfg, f, indent=2)
+            # Save the default config to file, replacing the old one
+            self._write_config_file(path, cfg)
+            self._update_config_cache(cfg, path)
+            self._config_dirty.set()
             decky.logger.info("Configuration reset to defaults and saved")
-            return cfg
+            return cfg.copy()
         except Exception as e:
-            decky.logger.error(f"Failed to reset config: {e}")
+            decky.logger.error("Failed to reset config: %s", e)
             return self._default_config()
 
     # ============= Network Methods =============
 
     async def _run_ping(self, host: str, timeout: int) -> Dict[str, Any]:
         """Run a single ping request and return results."""
+        if async_ping is not None and not self._icmp_unavailable:
+            try:
+                host_obj = await async_ping(
+                    host, count=1, timeout=timeout, privileged=False
+                )
+                return {
+                    "host": host,
+                    "success": host_obj.is_alive,
+                    "rc": 0 if host_obj.is_alive else 1,
+                }
+            except SocketPermissionError:
+                # Concurrent multi-target pings may all hit this, only log it once
+                if not self._icmp_unavailable:
+                    self._icmp_unavailable = True
+                    decky.logger.warning(
+                        "ICMP sockets not permitted, falling back to ping binary"
+                    )
+            except Exception as e:
+                decky.logger.error("Ping failed for %s: %s", host, e)
+                return {"host": host, "success": False, "rc": -1, "error": str(e)}
+
+        return await self._run_ping_subprocess(host, timeout)
+
+    def _ping_targets(self, cfg: Dict[str, Any]) -> List[str]:
+        """Return the configured probe hosts, falling back to ping_target."""
+        raw = cfg.get("ping_targets")
+        # A hand-edited string would otherwise be iterated character by character
+        targets = [str(t) for t in raw if t] if isinstance(raw, list) else []
+        return targets or [str(cfg.get("ping_target") or self.DEFAULT_PING_TARGET)]
+
+    async def _run_multiping(self, hosts: List[str], timeout: int) -> Dict[str, Any]:
+        """Ping several hosts at once; the network is up if any host responds."""
+        if len(hosts) == 1:
+            return await self._run_ping(hosts[0], timeout)
+
+        results: Optional[List[Dict[str, Any]]] = None
+        if async_multiping is not None and not self._icmp_unavailable:
+            try:
+                results = await self._run_icmp_multiping(hosts, timeout)
+            except SocketPermissionError:
+                if not self._icmp_unavailable:
+                    self._icmp_unavailable = True
+                    decky.logger.warning(
+                        "ICMP sockets not permitted, falling back to ping binary"
+                    )
+            except Exception as e:
+                decky.logger.error("Ping failed for %s: %s", hosts, e)
+                return {"host": hosts[0], "success": False, "rc": -1, "error": str(e)}
+
+        if results is None:
+            results = await asyncio.gather(
+                *(self._run_ping_subprocess(h, timeout) for h in hosts)
+            )
+
+        for result in results:
+            if result.get("success"):
+                return result
+        return results[0]
+
+    async def _run_icmp_multiping(
+        self, hosts: List[str], timeout: int
+    ) -> List[Dict[str, Any]]:
+        """Ping hosts in one icmplib batch, reporting unresolvable names as down.
+
+        Names are resolved up front because async_multiping fails the whole
+        batch if any single lookup fails.
+        """
+        names = [h for h in hosts if is_hostname(h)]
+        resolved = await asyncio.gather(
+            *(async_resolve(n) for n in names), return_exceptions=True
+        )
+        lookups = dict(zip(names, resolved))
+        results: List[Dict[str, Any]] = []
+        addresses: List[str] = []
+        pending: List[Dict[str, Any]] = []
+        for host in hosts:
+            lookup = lookups.get(host, [host])
+            result: Dict[str, Any] = {"host": host, "success": False, "rc": -1}
+            if isinstance(lookup, Exception):
+                decky.logger.warning("Ping target %s could not be resolved", host)
+                result["error"] = str(lookup)
+            else:
+                addresses.append(lookup[0])
+                pending.append(result)
+            results.append(result)
+
+        if addresses:
+            host_objs = await async_multiping(
+                addresses,
+                count=1,
+                timeout=timeout,
+                privileged=False,
+                concurrent_tasks=len(addresses),
+            )
+            for result, host_obj in zip(pending, host_objs):
+                result["success"] = host_obj.is_alive
+                result["rc"] = 0 if host_obj.is_alive else 1
+        return results
+
+    async def _run_ping_subprocess(self, host: str, timeout: int) -> Dict[str, Any]:
+        """Run a single ping via the system ping binary."""
         try:
             proc = await asyncio.create_subprocess_exec(
                 "ping",
@@ -174,19 +358,19 @@ class Plugin:
             rc = await asyncio.wait_for(proc.wait(), timeout=timeout + 1)
             return {"host": host, "success": rc == 0, "rc": rc}
         except asyncio.TimeoutError:
-            decky.logger.warning(f"Ping timeout for {host}")
+            decky.logger.warning("Ping timeout for %s", host)
             return {"host": host, "success": False, "rc": -1, "error": "timeout"}
         except Exception as e:
-            decky.logger.error(f"Ping failed for {host}: {e}")
+            decky.logger.error("Ping failed for %s: %s", host, e)
             return {"host": host, "success": False, "rc": -1, "error": str(e)}
 
     async def test_ping(self) -> Dict[str, Any]:
         """Test ping connectivity."""
         cfg = await self.get_config()
-        host = str(cfg.get("ping_target") or self.DEFAULT_PING_TARGET)
+        hosts = self._ping_targets(cfg)
         timeout = int(cfg.get("ping_timeout_sec", 2) or 2)
 
-        result = await self._run_ping(host, timeout)
+        result = await self._run_multiping(hosts, timeout)
         await decky.emit(
             "ping_status",
             result.get("host"),
@@ -203,58 +387,102 @@ class Plugin:
         protocol = "https" if config.get("use_https") else "http"
         login_ip = config.get("login_ip", self.DEFAULT_LOGIN_IP)
         login_path = config.get("login_path", "/drcom/login")
+        return self._build_login_url_cached(protocol, login_ip, login_path)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _build_login_url_cached(protocol: str, login_ip: str, login_path: str) -> str:
+        """Format the login URL, memoized per (protocol, ip, path)."""
         return f"{protocol}://{login_ip}{login_path}"
 
     def _make_http_request(
         self,
         method: str,
         url: str,
-        params: Dict[str, str],
+        query: str,
+        success_check: bytes = b"",
     ) -> Dict[str, Any]:
-        """Make HTTP request to login server."""
+        """Make HTTP request to login server with an already urlencoded query.
+
+        The body is kept as bytes and searched for success_check directly; only
+        the leading BODY_PREVIEW_BYTES are decoded for logging and the result.
+        Without a success_check only those preview bytes are read at all.
+        """
         try:
             if method == "GET":
-                query = urllib.parse.urlencode(params)
                 full_url = url + "?" + query
-                decky.logger.info(f"GET {full_url[:150]}...")
-
-                req = urllib.request.Request(full_url, method="GET")
-                req.add_header("User-Agent", self.USER_AGENT)
+                decky.logger.info("GET %.150s...", full_url)
 
-                with urllib.request.urlopen(req, timeout=self.HTTP_TIMEOUT) as res:
-                    body = res.read().decode(errors="ignore")
-                    status = res.getcode()
-                    decky.logger.info(f"Response: {status}, size: {len(body)} bytes")
-                    return {"status": status, "body": body}
+                with self._opener.open(full_url, timeout=self.HTTP_TIMEOUT) as res:
+                    body_bytes = self._read_body(res, success_check)
+                    return self._http_result(
+                        res.getcode(), body_bytes, success_check, not success_check
+                    )
 
             else:  # POST
-                decky.logger.info(f"POST {url}")
-                data = urllib.parse.urlencode(params).encode()
-                req = urllib.request.Request(url, data=data, method="POST")
-                req.add_header("Content-Type", "application/x-www-form-urlencoded")
-                req.add_header("User-Agent", self.USER_AGENT)
-
-                with urllib.request.urlopen(req, timeout=self.HTTP_TIMEOUT) as res:
-                    body = res.read().decode(errors="ignore")
-                    status = res.getcode()
-                    decky.logger.info(f"Response: {status}, size: {len(body)} bytes")
-                    return {"status": status, "body": body}
+                decky.logger.info("POST %s", url)
+                # urllib sends a form-urlencoded Content-Type for POST data by default
+                data = query.encode()
+                with self._opener.open(url, data=data, timeout=self.HTTP_TIMEOUT) as res:
+                    body_bytes = self._read_body(res, success_check)
+                    return self._http_result(
+                        res.getcode(), body_bytes, success_check, not success_check
+                    )
 
         except urllib.error.HTTPError as e:
-            decky.logger.error(f"HTTP Error {e.code}: {e.reason}")
+            decky.logger.error("HTTP Error %s: %s", e.code, e.reason)
             return {"status": e.code, "body": "", "error": f"HTTP {e.code}"}
         except urllib.error.URLError as e:
-            decky.logger.error(f"URL Error: {e.reason}")
+            decky.logger.error("URL Error: %s", e.reason)
             return {"status": -1, "body": "", "error": str(e.reason)}
         except Exception as e:
-            decky.logger.error(f"Request failed: {type(e).__name__}: {e}")
+            decky.logger.error("Request failed: %s: %s", type(e).__name__, e)
             return {"status": -1, "body": "", "error": str(e)}
 
-    async def do_login(self) -> Dict[str, Any]:
-        """Perform campus network login."""
-        cfg = await self.get_config()
+    def _read_body(self, res: Any, success_check: bytes) -> bytes:
+        """Read a urllib response body, only the preview bytes if nothing to check."""
+        if success_check:
+            return res.read()
+        return res.read(self.BODY_PREVIEW_BYTES)
+
+    def _http_result(
+        self,
+        status: int,
+        body_bytes: bytes,
+        success_check: bytes,
+        truncated: bool = False,
+    ) -> Dict[str, Any]:
+        """Build the request result from the raw (possibly truncated) response body."""
+        if truncated:
+            decky.logger.info(
+                "Response: %d, preview: %d bytes", status, len(body_bytes)
+            )
+        else:
+            decky.logger.info("Response: %d, size: %d bytes", status, len(body_bytes))
+        preview = body_bytes[: self.BODY_PREVIEW_BYTES].decode(errors="ignore")
+        return {
+            "status": status,
+            "body": preview,
+            "matched": bool(success_check) and success_check in body_bytes,
+        }
 
-        # Validate required credentials
+    def _success_check_bytes(self, success_check: str) -> bytes:
+        """Return the UTF-8 encoded success check string, cached per value."""
+        if success_check != self._success_check_str:
+            self._success_check_str = success_check
+            self._success_check_encoded = success_check.encode("utf-8")
+        return self._success_check_encoded
+
+    def _encode_static_params(self, params: Dict[str, str]) -> str:
+        """Urlencode every login parameter except the timestamp, cached per params."""
+        key = tuple((k, val) for k, val in params.items() if k != "v")
+        if key != self._encoded_static_key:
+            self._encoded_static_params = urllib.parse.urlencode(key)
+            self._encoded_static_key = key
+        return self._encoded_static_params
+
+    def _login_not_configured(self, cfg: Dict[str, Any]) -> Dict[str, Any]:
+        """Log and return the result for a login skipped due to missing credentials."""
         if not cfg.get("params", {}).get("DDDDD"):
             decky.logger.warning("Login skipped: Student ID (DDDDD) not configured")
             return {
@@ -263,27 +491,42 @@ class Plugin:
                 "error": "Student ID not configured",
             }
 
-        if not cfg.get("params", {}).get("upass"):
-            decky.logger.warning("Login skipped: Password (upass) not configured")
-            return {"success": False, "status": -1, "error": "Password not configured"}
+        decky.logger.warning("Login skipped: Password (upass) not configured")
+        return {"success": False, "status": -1, "error": "Password not configured"}
+
+    async def do_login(self) -> Dict[str, Any]:
+        """Perform campus network login."""
+        cfg = await self.get_config()
+
+        # Credentials are validated whenever the config is loaded or saved
+        if not self._login_configured:
+            return self._login_not_configured(cfg)
 
         # Build login request
         url = self._build_login_url(cfg)
         method = cfg.get("method", "GET").upper()
-        params = cfg.get("params", {}).copy()
+        params = cfg.get("params", {})
         success_check = cfg.get("success_check_string", "")
 
-        # Add timestamp parameter
-        params["v"] = str(int(time.time() * 1000) % 10000)
+        # Append timestamp parameter to the cached encoding of the static ones
+        static_query = self._encode_static_params(params)
+        now_ms = int(time.time() * 1000) % 10000
+        query = (static_query + "&" if static_query else "") + "v=" + str(now_ms)
+        param_count = len(params) + (0 if "v" in params else 1)
 
         decky.logger.info(
-            f"Login attempt: {method} {url} with {len(params)} parameters"
+            "Login attempt: %s %s with %d parameters", method, url, param_count
         )
 
-        # Run blocking HTTP request in thread pool
-        loop = asyncio.get_event_loop()
+        # Run blocking HTTP request on the dedicated HTTP worker thread
+        loop = asyncio.get_running_loop()
         res = await loop.run_in_executor(
-            None, self._make_http_request, method, url, params
+            self._executor,
+            self._make_http_request,
+            method,
+            url,
+            query,
+            self._success_check_bytes(success_check),
         )
 
         status = res.get("status", -1)
@@ -294,7 +537,7 @@ class Plugin:
         success = False
         if status == 200:
             if success_check:
-                success = success_check in body
+                success = bool(res.get("matched"))
             else:
                 success = True
 
@@ -303,13 +546,13 @@ class Plugin:
         await decky.emit("login_status", success, status, message, int(time.time()))
 
         decky.logger.info(
-            f"Login {'succeeded' if success else 'failed'}: status={status}"
+            "Login %s: status=%s", "succeeded" if success else "failed", status
         )
 
         return {
             "success": success,
             "status": status,
-            "body": body[:1024],
+            "body": body[: self.BODY_PREVIEW_BYTES],
             "error": error,
         }
 
@@ -317,93 +560,146 @@ class Plugin:
 
     async def start_ping_monitor(self) -> None:
         """Start the background ping monitor task."""
-        if (
-            self._monitor_task
-            and isinstance(self._monitor_task, asyncio.Task)
-            and not self._monitor_task.done()
-        ):
+        if self._monitor_task and not self._monitor_task.done():
             decky.logger.warning("Monitor already running")
             return
 
         if not self.loop:
-            self.loop = asyncio.get_event_loop()
+            self.loop = asyncio.get_running_loop()
 
         self._monitor_task = self.loop.create_task(self._ping_monitor())
         decky.logger.info("Ping monitor started")
 
     async def stop_ping_monitor(self) -> None:
         """Stop the background ping monitor task."""
-        if self._monitor_task and isinstance(self._monitor_task, asyncio.Task):
+        if self._monitor_task:
             self._monitor_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await self._monitor_task
-            except asyncio.CancelledError:
-                pass
             self._monitor_task = None
             decky.logger.info("Ping monitor stopped")
 
     async def is_monitor_running(self) -> bool:
         """Check if ping monitor is currently running."""
-        return bool(
-            self._monitor_task
-            and isinstance(self._monitor_task, asyncio.Task)
-            and not self._monitor_task.done()
-        )
+        return bool(self._monitor_task and not self._monitor_task.done())
 
     async def _ping_monitor(self) -> None:
         """Background task that monitors network and triggers login when needed."""
         consecutive_failures = 0
+        consecutive_successes = 0
+        cfg: Optional[Dict[str, Any]] = None
+        warned_not_configured = False
+        running_late = False
+        last_emitted_state: Optional[bool] = None
+        last_emit_ts = 0.0
         decky.logger.info("Ping monitor task started")
 
         try:
             while True:
-                cfg = await self.get_config()
-
-                host = cfg.get("ping_target") or self.DEFAULT_PING_TARGET
-                interval = int(cfg.get("ping_interval_sec", 60) or 60)
-                timeout = int(cfg.get("ping_timeout_sec", 2) or 2)
-                threshold = int(cfg.get("consecutive_failures_threshold", 3) or 3)
-                backoff = int(cfg.get("backoff_attempt_sec", 60) or 60)
+                tick_start = time.monotonic()
+                now_wall = int(time.time())
+
+                # Only re-read the config after save_config/reset_config
+                if cfg is None or self._config_dirty.is_set():
+                    self._config_dirty.clear()
+                    cfg = await self.get_config()
+                    hosts = self._ping_targets(cfg)
+                    interval = int(cfg.get("ping_interval_sec", 60) or 60)
+                    timeout = int(cfg.get("ping_timeout_sec", 2) or 2)
+                    threshold = int(cfg.get("consecutive_failures_threshold", 3) or 3)
+                    backoff = int(cfg.get("backoff_attempt_sec", 60) or 60)
+                    current_interval = interval
+                    warned_not_configured = False
 
                 # Run ping
-                result = await self._run_ping(host, timeout)
+                result = await self._run_multiping(hosts, timeout)
                 success = result.get("success", False)
+                host = result.get("host", hosts[0])
+
+                # Only notify the frontend on state changes, plus a slow heartbeat
+                should_emit = (
+                    success != last_emitted_state
+                    or tick_start - last_emit_ts > self.PING_STATUS_HEARTBEAT_SEC
+                )
+                if should_emit:
+                    last_emitted_state = success
+                    last_emit_ts = tick_start
 
                 if success:
+                    consecutive_successes += 1
+                    # Poll less often while the network stays healthy
+                    if consecutive_successes >= self.HEALTHY_STREAK_BEFORE_BACKOFF:
+                        max_interval = min(interval * 4, self.MAX_PING_INTERVAL_SEC)
+                        current_interval = max(
+                            interval, min(current_interval * 2, max_interval)
+                        )
                     if consecutive_failures > 0:
                         consecutive_failures = 0
                         decky.logger.info("Network connectivity restored")
-                    await decky.emit(
-                        "ping_status",
-                        host,
-                        True,
-                        consecutive_failures,
-                        int(time.time()),
-                    )
+                    if should_emit:
+                        await decky.emit(
+                            "ping_status",
+                            host,
+                            True,
+                            consecutive_failures,
+                            now_wall,
+                        )
                 else:
                     consecutive_failures += 1
-                    await decky.emit(
-                        "ping_status",
-                        host,
-                        False,
-                        consecutive_failures,
-                        int(time.time()),
-                    )
+                    consecutive_successes = 0
+                    if not warned_not_configured:
+                        current_interval = interval
+                    if should_emit:
+                        await decky.emit(
+                            "ping_status",
+                            host,
+                            False,
+                            consecutive_failures,
+                            now_wall,
+                        )
                     decky.logger.warning(
-                        f"Ping failure {consecutive_failures}/{threshold}"
+                        "Ping failure %d/%d", consecutive_failures, threshold
                     )
 
+                    # Without credentials a login can never succeed, so just poll slowly
+                    if consecutive_failures >= threshold and not self._login_configured:
+                        if not warned_not_configured:
+                            decky.logger.warning(
+                                "Failure threshold reached but credentials are not "
+                                "configured, skipping auto-login"
+                            )
+                            warned_not_configured = True
+                        consecutive_failures = 0
+                        current_interval = max(interval, self.MAX_PING_INTERVAL_SEC)
+
                     # Trigger login if threshold reached
-                    if consecutive_failures >= threshold:
+                    elif consecutive_failures >= threshold:
                         decky.logger.warning("Failure threshold reached, attempting login")
                         await self.do_login()
                         consecutive_failures = 0
                         await asyncio.sleep(backoff)
-
-                await asyncio.sleep(interval)
+                        tick_start = time.monotonic()
+
+                # Pace against a monotonic deadline so work time doesn't add drift
+                deadline = tick_start + current_interval
+                sleep_for = deadline - time.monotonic()
+                if sleep_for > 0:
+                    running_late = False
+                    # Wake early when the config changes so new settings apply now
+                    try:
+                        await asyncio.wait_for(
+                            self._config_dirty.wait(), timeout=sleep_for
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    # Warn once per streak of late ticks, they pile up while offline
+                    log = decky.logger.debug if running_late else decky.logger.warning
+                    log("Ping monitor tick overran its interval by %.1fs", -sleep_for)
+                    running_late = True
 
         except asyncio.CancelledError:
             decky.logger.info("Ping monitor cancelled")
         except Exception as e:
-            decky.logger.error(f"Ping monitor error: {e}")
+            decky.logger.error("Ping monitor error: %s", e)
             await asyncio.sleep(5)  # Prevent tight loop on errors
@@ -27,6 +27,7 @@ type Config = {
   method: string;
   params: { [key: string]: string };
   ping_target: string;
+  ping_targets?: string[];
   ping_interval_sec: number;
   ping_timeout_sec: number;
   consecutive_failures_threshold: number;